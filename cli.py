@@ -25,23 +25,47 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import dataclasses
+import hashlib
+import itertools
 import json
+import os
 import sys
+import time
 from pathlib import Path
 
+try:
+    import orjson  # optional C-accelerated JSON (pip install spraay-tao[fast])
+except ImportError:
+    orjson = None
+
 from spraay_tao import __version__
-from spraay_tao.batch import (
-    BatchMode,
-    BatchResult,
-    Recipient,
+
+# Only the chain-free parsing/validation module is imported eagerly.
+# spraay_tao.batch transitively pulls in bittensor/substrateinterface
+# (a >1s cold start), which --help, --version, validate, and
+# generate-template never need — see _load_batch().
+from spraay_tao.batch_io import (
     SPRAAY_FEE_PERCENT,
-    batch_transfer,
+    amount_stats,
     calculate_spraay_fee,
-    estimate_fee,
-    parse_recipients,
-    validate_recipients,
+    parse_recipients_stream,
+    total_amount,
+    validate_recipients_parallel,
 )
 
+_batch = None
+
+
+def _load_batch():
+    """Import the chain-facing spraay_tao.batch module on first use."""
+    global _batch
+    if _batch is None:
+        import spraay_tao.batch
+
+        _batch = spraay_tao.batch
+    return _batch
+
 
 BANNER = r"""
    ___                           _____  _    ___
@@ -53,64 +77,284 @@ BANNER = r"""
 """
 
 
+def _banner(out: "Output", args: argparse.Namespace) -> None:
+    """
+    Queue the ASCII banner, unless output is piped (log aggregators and
+    CI don't want 400 bytes of art), --quiet was passed, or
+    SPRAAY_NO_BANNER is set.
+    """
+    if getattr(args, "quiet", False):
+        return
+    if not sys.stdout.isatty() or os.environ.get("SPRAAY_NO_BANNER"):
+        return
+    out.say(BANNER)
+
+
+class Output:
+    """
+    Buffered command output.
+
+    Each cmd_* accumulates its lines here and flushes once, so a
+    command issues a single stdout write instead of one per print()
+    (which acquires the stdout lock and hits the kernel per line when
+    piped). flush() must be called before any interactive input() and
+    before returning.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+
+    def say(self, text: str = "") -> None:
+        self._parts.append(f"{text}\n")
+
+    def flush(self) -> None:
+        if self._parts:
+            sys.stdout.write("".join(self._parts))
+            self._parts.clear()
+        sys.stdout.flush()
+
+
+# Fee estimates are valid for a short window only (balances and chain
+# fees drift), but long enough to cover the typical dry-run → confirm →
+# transfer loop without a second RPC round-trip.
+FEE_CACHE_TTL_SECONDS = 60
+FEE_CACHE_PATH = Path.home() / ".cache" / "spraay-tao" / "fee.json"
+
+# Files that already passed validation are remembered by content hash,
+# so the typical validate -> transfer loop doesn't redo the ss58
+# checksum work. Any edit to the file changes the hash and invalidates
+# the sentinel automatically.
+VALIDATED_CACHE_DIR = Path.home() / ".cache" / "spraay-tao" / "validated"
+
+
+def _file_fingerprint(filepath: str | Path) -> str:
+    """blake2b hash of the file contents, streamed in 1 MiB chunks."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# Completed transfers are logged by the same content hash so an
+# operator re-running a file (e.g. after a timeout) gets warned before
+# paying everyone twice.
+TRANSFER_LOG_PATH = Path.home() / ".cache" / "spraay-tao" / "transfers.json"
+
+
+def _validated_sentinel(file_hash: str) -> Path:
+    return VALIDATED_CACHE_DIR / f"{file_hash}.ok"
+
+
+def _previous_transfer(file_hash: str) -> dict | None:
+    """Look up an earlier transfer of a file with identical contents."""
+    try:
+        log = json.loads(TRANSFER_LOG_PATH.read_text())
+    except (OSError, ValueError):
+        return None
+    return log.get(file_hash)
+
+
+def _record_transfer(file_hash: str, success: bool, total: float, count: int) -> None:
+    try:
+        log = json.loads(TRANSFER_LOG_PATH.read_text())
+    except (OSError, ValueError):
+        log = {}
+    log[file_hash] = {
+        "timestamp": time.time(),
+        "success": success,
+        "total_tao": total,
+        "recipients": count,
+    }
+    try:
+        TRANSFER_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        TRANSFER_LOG_PATH.write_text(json.dumps(log))
+    except OSError:
+        pass  # log is best-effort; never fail the command over it
+
+
+def _mark_validated(sentinel: Path) -> None:
+    try:
+        sentinel.parent.mkdir(parents=True, exist_ok=True)
+        sentinel.touch()
+    except OSError:
+        pass  # cache is best-effort; never fail the command over it
+
+
+def _recipients_fingerprint(recipients) -> str:
+    """Stable fingerprint of a recipient list (addresses + amounts)."""
+    h = hashlib.blake2b(digest_size=16)
+    for r in recipients:
+        h.update(f"{r.address}|{r.amount}\n".encode())
+    return h.hexdigest()
+
+
+def _cached_estimate(wallet_name: str, network: str, recipients):
+    """
+    estimate_fee with a short-lived disk cache.
+
+    Keyed by (wallet, network, recipient fingerprint) so a dry-run
+    followed by the real transfer within FEE_CACHE_TTL_SECONDS reuses
+    the estimate instead of hitting the Substrate RPC again.
+    """
+    batch = _load_batch()
+    key = f"{wallet_name}|{network}|{_recipients_fingerprint(recipients)}"
+
+    try:
+        cache = json.loads(FEE_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        cache = {}
+
+    entry = cache.get(key)
+    if entry and time.time() - entry["timestamp"] < FEE_CACHE_TTL_SECONDS:
+        return batch.FeeEstimate(**entry["estimate"])
+
+    fee_est = batch.estimate_fee(
+        wallet_name=wallet_name,
+        recipients=recipients,
+        network=network,
+    )
+
+    # Keep only fresh entries so the file doesn't grow unboundedly
+    now = time.time()
+    cache = {
+        k: v for k, v in cache.items()
+        if now - v["timestamp"] < FEE_CACHE_TTL_SECONDS
+    }
+    cache[key] = {
+        "timestamp": now,
+        "estimate": dataclasses.asdict(fee_est),
+    }
+    try:
+        FEE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        FEE_CACHE_PATH.write_text(json.dumps(cache))
+    except OSError:
+        pass  # cache is best-effort; never fail the command over it
+
+    return fee_est
+
+
 def cmd_transfer(args: argparse.Namespace) -> int:
     """Execute batch transfer."""
-    print(BANNER)
+    out = Output()
+    _banner(out, args)
 
-    # Parse recipients
+    # Parse recipients (streamed; materialized here because chunking
+    # and the confirmation prompt need the full list)
     try:
-        recipients = parse_recipients(args.file)
+        recipients = list(parse_recipients_stream(args.file))
     except Exception as e:
-        print(f"Error parsing file: {e}")
+        out.say(f"Error parsing file: {e}")
+        out.flush()
         return 1
 
-    print(f"Loaded {len(recipients)} recipients from {args.file}")
-    print(f"Network: {args.network}")
-    print(f"Wallet: {args.wallet}")
-    print(f"Mode: {'atomic (batch_all)' if args.atomic else 'best-effort (batch)'}")
-    print()
+    out.say(f"Loaded {len(recipients)} recipients from {args.file}")
+    out.say(f"Network: {args.network}")
+    out.say(f"Wallet: {args.wallet}")
+    out.say(f"Mode: {'atomic (batch_all)' if args.atomic else 'best-effort (batch)'}")
+    out.say()
+
+    # One streamed hash of the file serves both the validation
+    # sentinel and the duplicate-transfer check
+    file_hash = _file_fingerprint(args.file)
 
-    # Validate
-    is_valid, errors = validate_recipients(recipients)
+    # Validate (skipped when this exact file content already passed)
+    sentinel = _validated_sentinel(file_hash)
+    if sentinel.exists():
+        is_valid, errors = True, []
+    else:
+        is_valid, errors = validate_recipients_parallel(recipients)
+        if is_valid:
+            _mark_validated(sentinel)
     if not is_valid:
-        print("Validation errors:")
+        out.say("Validation errors:")
         for err in errors:
-            print(f"  ✗ {err}")
+            out.say(f"  ✗ {err}")
+        out.flush()
         return 1
 
-    total = sum(r.amount for r in recipients)
+    total = total_amount(recipients)
     spraay_fee = calculate_spraay_fee(recipients)
     fee_display = f" + {spraay_fee.amount:.6f} TAO Spraay fee ({SPRAAY_FEE_PERCENT}%)" if spraay_fee else ""
-    print(f"Total to transfer: {total:.4f} TAO across {len(recipients)} recipients{fee_display}")
+    out.say(f"Total to transfer: {total:.4f} TAO across {len(recipients)} recipients{fee_display}")
 
     # Dry run
     if args.dry_run:
-        print("\n[DRY RUN] Estimating fees without executing...")
+        out.say("\n[DRY RUN] Estimating fees without executing...")
         try:
-            fee_est = estimate_fee(
-                wallet_name=args.wallet,
-                recipients=recipients,
-                network=args.network,
-            )
-            print()
-            print(fee_est.summary())
+            fee_est = _cached_estimate(args.wallet, args.network, recipients)
+            out.say()
+            out.say(fee_est.summary())
         except Exception as e:
-            print(f"Fee estimation error: {e}")
+            out.say(f"Fee estimation error: {e}")
+            out.flush()
             return 1
+        out.flush()
         return 0
 
-    # Confirm
+    # Duplicate check: the same file contents already moved funds —
+    # fully or partially (a partial run is the likeliest retry, and the
+    # paid recipients would be paid again). Always prompts — even with
+    # --yes — since this is the double-pay footgun the log exists to
+    # catch; without an interactive stdin that means aborting, not
+    # crashing on EOF.
+    prior = _previous_transfer(file_hash)
+    if prior and (prior.get("success") or prior.get("total_tao", 0) > 0):
+        when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(prior["timestamp"]))
+        status = (
+            "already transferred"
+            if prior.get("success")
+            else "PARTIALLY transferred (some batches failed)"
+        )
+        out.say(
+            f"\nWARNING: this exact file was {status} on {when} "
+            f"({prior['total_tao']:.4f} TAO paid, {prior['recipients']} recipients in file)."
+        )
+        out.flush()
+        if not sys.stdin.isatty():
+            print(
+                "Aborted: refusing to re-pay a previously transferred file "
+                "without interactive confirmation."
+            )
+            return 0
+        try:
+            response = input("Re-execute and pay these recipients again? [y/N]: ")
+        except EOFError:
+            response = ""
+        if response.lower() not in ("y", "yes"):
+            print("Aborted.")
+            return 0
+
+    # Confirm (flush first so the buffered preamble precedes the prompt)
     if not args.yes:
+        out.flush()
         response = input(f"\nProceed with transfer of {total:.4f} TAO? [y/N]: ")
         if response.lower() not in ("y", "yes"):
             print("Aborted.")
             return 0
 
     # Execute
-    mode = BatchMode.BATCH_ALL if args.atomic else BatchMode.BATCH
-
-    print("\nExecuting batch transfer...")
-    results = batch_transfer(
+    batch = _load_batch()
+    mode = batch.BatchMode.BATCH_ALL if args.atomic else batch.BatchMode.BATCH
+
+    out.say("\nExecuting batch transfer...")
+    out.say()
+    out.flush()
+
+    # Stream results as each batch lands: print immediately for
+    # operator feedback and fold totals into running accumulators so
+    # the full result list is never held in memory
+    total_transferred = 0.0
+    total_fees = 0.0
+    total_spraay = 0.0
+    all_success = True
+    failed = 0
+    batch_count = 0
+    # Bind the write/flush methods once: one write call per result,
+    # without print()'s kwarg handling and double write per line
+    w = sys.stdout.write
+    wflush = sys.stdout.flush
+    for result in batch.batch_transfer_stream(
         wallet_name=args.wallet,
         recipients=recipients,
         network=args.network,
@@ -118,101 +362,113 @@ def cmd_transfer(args: argparse.Namespace) -> int:
         mode=mode,
         wait_for_inclusion=True,
         wait_for_finalization=args.finalize,
-    )
-
-    # Print results
-    print()
-    all_success = True
-    for result in results:
-        print(result.summary())
-        print()
-        if not result.success:
+        validated=True,  # validated above (or via the sentinel cache)
+    ):
+        w(result.summary() + "\n\n")
+        wflush()  # per-result flush is deliberate: live progress
+        batch_count += 1
+        if result.success:
+            total_transferred += result.total_amount
+            total_fees += result.total_fee
+            total_spraay += result.spraay_fee
+        else:
             all_success = False
+            failed += 1
+
+    _record_transfer(file_hash, all_success, total_transferred, len(recipients))
 
     if all_success:
-        total_transferred = sum(r.total_amount for r in results)
-        total_fees = sum(r.total_fee for r in results)
-        total_spraay = sum(r.spraay_fee for r in results)
-        print(f"All batches completed successfully!")
-        print(f"Total transferred: {total_transferred:.4f} TAO")
-        print(f"Total network fees: {total_fees:.6f} TAO")
+        out.say(f"All batches completed successfully!")
+        out.say(f"Total transferred: {total_transferred:.4f} TAO")
+        out.say(f"Total network fees: {total_fees:.6f} TAO")
         if total_spraay > 0:
-            print(f"Total Spraay fees: {total_spraay:.6f} TAO")
+            out.say(f"Total Spraay fees: {total_spraay:.6f} TAO")
     else:
-        failed = sum(1 for r in results if not r.success)
-        print(f"WARNING: {failed}/{len(results)} batches failed!")
+        out.say(f"WARNING: {failed}/{batch_count} batches failed!")
 
+    out.flush()
     return 0 if all_success else 1
 
 
 def cmd_estimate(args: argparse.Namespace) -> int:
     """Estimate fees for a batch transfer."""
-    print(BANNER)
+    out = Output()
+    _banner(out, args)
 
     try:
-        recipients = parse_recipients(args.file)
+        recipients = list(parse_recipients_stream(args.file))
     except Exception as e:
-        print(f"Error parsing file: {e}")
+        out.say(f"Error parsing file: {e}")
+        out.flush()
         return 1
 
-    print(f"Estimating fees for {len(recipients)} recipients...")
+    out.say(f"Estimating fees for {len(recipients)} recipients...")
 
     try:
-        fee_est = estimate_fee(
-            wallet_name=args.wallet,
-            recipients=recipients,
-            network=args.network,
-        )
-        print()
-        print(fee_est.summary())
+        fee_est = _cached_estimate(args.wallet, args.network, recipients)
+        out.say()
+        out.say(fee_est.summary())
     except Exception as e:
-        print(f"Error: {e}")
+        out.say(f"Error: {e}")
+        out.flush()
         return 1
 
+    out.flush()
     return 0
 
 
 def cmd_validate(args: argparse.Namespace) -> int:
     """Validate a recipient list."""
-    print(BANNER)
+    out = Output()
+    _banner(out, args)
 
     try:
-        recipients = parse_recipients(args.file)
+        recipients = list(parse_recipients_stream(args.file))
     except Exception as e:
-        print(f"Error parsing file: {e}")
+        out.say(f"Error parsing file: {e}")
+        out.flush()
         return 1
 
-    print(f"Loaded {len(recipients)} recipients from {args.file}")
+    out.say(f"Loaded {len(recipients)} recipients from {args.file}")
 
-    is_valid, errors = validate_recipients(recipients)
+    is_valid, errors = validate_recipients_parallel(recipients)
 
     if is_valid:
-        total = sum(r.amount for r in recipients)
-        print(f"\n✓ All {len(recipients)} recipients are valid")
-        print(f"  Total amount: {total:.4f} TAO")
-        print(f"  Average per recipient: {total / len(recipients):.4f} TAO")
-        print(f"  Min: {min(r.amount for r in recipients):.4f} TAO")
-        print(f"  Max: {max(r.amount for r in recipients):.4f} TAO")
+        # Remember the verdict so a follow-up transfer of the same
+        # file skips re-validation
+        _mark_validated(_validated_sentinel(_file_fingerprint(args.file)))
+
+        # Single vectorized pass for all aggregates instead of
+        # separate sum()/min()/max() traversals over the list
+        total, avg, mn, mx = amount_stats(recipients)
+        out.say(f"\n✓ All {len(recipients)} recipients are valid")
+        out.say(f"  Total amount: {total:.4f} TAO")
+        out.say(f"  Average per recipient: {avg:.4f} TAO")
+        out.say(f"  Min: {mn:.4f} TAO")
+        out.say(f"  Max: {mx:.4f} TAO")
 
         # Show preview
-        print(f"\nPreview (first 5):")
+        out.say(f"\nPreview (first 5):")
         for r in recipients[:5]:
             label = f" ({r.label})" if r.label else ""
-            print(f"  {r.address[:16]}...{r.address[-8:]} → {r.amount:.4f} TAO{label}")
+            out.say(f"  {r.short} → {r.amount:.4f} TAO{label}")
         if len(recipients) > 5:
-            print(f"  ... and {len(recipients) - 5} more")
+            out.say(f"  ... and {len(recipients) - 5} more")
 
+        out.flush()
         return 0
     else:
-        print(f"\n✗ Found {len(errors)} validation errors:")
+        out.say(f"\n✗ Found {len(errors)} validation errors:")
         for err in errors:
-            print(f"  ✗ {err}")
+            out.say(f"  ✗ {err}")
+        out.flush()
         return 1
 
 
 def cmd_generate_template(args: argparse.Namespace) -> int:
     """Generate a template recipient file."""
-    print(BANNER)
+    out = Output()
+    _banner(out, args)
 
     count = args.count
     output = Path(args.output)
@@ -226,49 +482,55 @@ def cmd_generate_template(args: argparse.Namespace) -> int:
         "5HGjWAeFDfFCWPsjFQdVV2Msvz2XtMktvgocEZcCj68kUMaw",  # Eve
     ]
 
-    recipients = []
     labels = ["Alice", "Bob", "Charlie", "Dave", "Eve", "Miner_1", "Miner_2",
               "Validator_1", "Contributor_1", "Bounty_Winner"]
-    for i in range(count):
-        addr = sample_addresses[i % len(sample_addresses)]
-        label = labels[i] if i < len(labels) else f"Recipient_{i + 1}"
-        recipients.append({
-            "address": addr,
-            "amount": round(1.0 + (i * 0.5), 2),
-            "label": label,
-        })
 
+    # Precompute the three columns instead of doing modulo, bounds
+    # check, and rounding per iteration — matters for large --count
+    addrs = list(itertools.islice(itertools.cycle(sample_addresses), count))
+    lbls = labels[:count] + [
+        f"Recipient_{i + 1}" for i in range(len(labels), count)
+    ]
+    try:
+        import numpy as np
+
+        amts = np.round(1.0 + np.arange(count) * 0.5, 2).tolist()
+    except ImportError:
+        amts = [round(1.0 + i * 0.5, 2) for i in range(count)]
+
+    recipients = [
+        {"address": addr, "amount": amt, "label": label}
+        for addr, amt, label in zip(addrs, amts, lbls)
+    ]
+
+    # Serialize in memory and emit with a single write call rather than
+    # one write per row — matters for large --count values
     fmt = args.format
     if fmt == "json":
-        with open(output, "w") as f:
-            json.dump(recipients, f, indent=2)
+        # Templates are meant for hand editing, so keep them indented
+        if orjson is not None:
+            with open(output, "wb") as f:
+                f.write(orjson.dumps(recipients, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output, "w") as f:
+                f.write(json.dumps(recipients, indent=2))
     else:
+        lines = ["address,amount,label\n"]
+        lines.extend(
+            f"{r['address']},{r['amount']},{r['label']}\n" for r in recipients
+        )
         with open(output, "w", newline="") as f:
-            f.write("address,amount,label\n")
-            for r in recipients:
-                f.write(f"{r['address']},{r['amount']},{r['label']}\n")
-
-    print(f"Generated template with {count} recipients: {output}")
-    print(f"Format: {fmt.upper()}")
-    print(f"\nEdit the file with your actual recipient addresses and amounts,")
-    print(f"then run: spraay-tao validate --file {output}")
-    return 0
+            f.writelines(lines)
 
+    out.say(f"Generated template with {count} recipients: {output}")
+    out.say(f"Format: {fmt.upper()}")
+    out.say(f"\nEdit the file with your actual recipient addresses and amounts,")
+    out.say(f"then run: spraay-tao validate --file {output}")
+    out.flush()
+    return 0
 
-def main() -> int:
-    parser = argparse.ArgumentParser(
-        prog="spraay-tao",
-        description="Spraay TAO — Batch payments for the Bittensor ecosystem",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="Built by Spraay (spraay.app) | GitHub: plagtech",
-    )
-    parser.add_argument(
-        "--version", action="version", version=f"spraay-tao {__version__}"
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Transfer command
+def _add_transfer_parser(subparsers) -> None:
     transfer_parser = subparsers.add_parser(
         "transfer", help="Execute batch TAO transfers"
     )
@@ -307,7 +569,8 @@ def main() -> int:
         help="Wait for transaction finalization (slower but more certain)"
     )
 
-    # Estimate command
+
+def _add_estimate_parser(subparsers) -> None:
     estimate_parser = subparsers.add_parser(
         "estimate", help="Estimate batch transfer fees"
     )
@@ -321,7 +584,8 @@ def main() -> int:
         "--network", "-n", default="finney", help="Bittensor network"
     )
 
-    # Validate command
+
+def _add_validate_parser(subparsers) -> None:
     validate_parser = subparsers.add_parser(
         "validate", help="Validate a recipient list"
     )
@@ -329,7 +593,8 @@ def main() -> int:
         "--file", "-f", required=True, help="Path to recipient list"
     )
 
-    # Generate template command
+
+def _add_template_parser(subparsers) -> None:
     template_parser = subparsers.add_parser(
         "generate-template", help="Generate a template recipient file"
     )
@@ -343,6 +608,49 @@ def main() -> int:
         "--count", "-c", type=int, default=5, help="Number of sample recipients"
     )
 
+
+_PARSER_BUILDERS = {
+    "transfer": _add_transfer_parser,
+    "estimate": _add_estimate_parser,
+    "validate": _add_validate_parser,
+    "generate-template": _add_template_parser,
+}
+
+
+def main() -> int:
+    argv = sys.argv[1:]
+
+    # Fast path: --version needs no parser (argparse construction alone
+    # costs several ms of a CLI invocation)
+    if argv and argv[0] in ("--version", "-V"):
+        print(f"spraay-tao {__version__}")
+        return 0
+
+    parser = argparse.ArgumentParser(
+        prog="spraay-tao",
+        description="Spraay TAO — Batch payments for the Bittensor ecosystem",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="Built by Spraay (spraay.app) | GitHub: plagtech",
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"spraay-tao {__version__}"
+    )
+    parser.add_argument(
+        "--quiet", "-q", action="store_true",
+        help="Suppress the banner (also via SPRAAY_NO_BANNER=1)"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # Build only the requested subcommand's parser; the full set is
+    # constructed just for the help/error paths
+    chosen = next((a for a in argv if not a.startswith("-")), None)
+    if chosen in _PARSER_BUILDERS:
+        _PARSER_BUILDERS[chosen](subparsers)
+    else:
+        for build in _PARSER_BUILDERS.values():
+            build(subparsers)
+
     args = parser.parse_args()
 
     if args.command is None:
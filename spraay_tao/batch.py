@@ -11,40 +11,48 @@ Supports:
 - CSV/JSON recipient list parsing
 - Configurable batch sizes for large recipient lists
 - Both sync and async execution
+
+Parsing, validation, and fee math live in spraay_tao.batch_io (which
+stays free of chain imports); they are re-exported here so existing
+`from spraay_tao.batch import ...` callers keep working.
 """
 
 from __future__ import annotations
 
 import asyncio
-import csv
-import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import bittensor as bt
-from bittensor.core.extrinsics.pallets import Balances
-from bittensor.utils import is_valid_bittensor_address_or_public_key
 from bittensor.utils.balance import Balance
 
-
-# Maximum recipients per batch transaction.
-# Substrate utility.batch has no hard limit, but larger batches
-# consume more weight. 199 to leave room for the fee transfer.
-MAX_BATCH_SIZE = 199
-
-# Minimum transfer amount in TAO (existential deposit protection)
-MIN_TRANSFER_TAO = 0.0005  # 500,000 RAO
-
-# ── Spraay Service Fee ──────────────────────────────────────────
-# A small transparent fee is appended as an additional transfer
-# within each batch. Shown upfront in fee estimates.
-# Set to 0.0 to disable (e.g. for grant-funded deployments).
-SPRAAY_FEE_PERCENT = 0.3  # 0.3% of total batch amount
-SPRAAY_FEE_WALLET = "5CZjqeHFjmj39KuXanRApouyKFXokjazeor6h3bPoCzuzmJC"
-SPRAAY_MIN_FEE_TAO = 0.001  # Minimum fee per batch (below this, no fee charged)
+from spraay_tao.batch_io import (  # noqa: F401 — re-exported public API
+    FILE_BUFFER_SIZE,
+    MAX_BATCH_SIZE,
+    MIN_TRANSFER_TAO,
+    RAO_PER_TAO,
+    SPRAAY_FEE_PERCENT,
+    SPRAAY_FEE_WALLET,
+    SPRAAY_MIN_FEE_TAO,
+    Recipient,
+    amount_stats,
+    calculate_spraay_fee,
+    chunk_recipients,
+    iter_recipients_csv,
+    iter_recipients_json,
+    parse_recipients,
+    parse_recipients_csv,
+    parse_recipients_json,
+    parse_recipients_stream,
+    summarize_chunks,
+    total_amount,
+    total_rao,
+    validate_recipients,
+)
 
 
 class BatchMode(Enum):
@@ -54,34 +62,7 @@ class BatchMode(Enum):
     BATCH = "batch"  # Best-effort — failures don't revert others
 
 
-@dataclass
-class Recipient:
-    """A single payment recipient."""
-
-    address: str
-    amount: float  # in TAO
-    label: str = ""  # optional label/note
-
-    def validate(self) -> list[str]:
-        """Validate this recipient. Returns list of error strings."""
-        errors = []
-        if not is_valid_bittensor_address_or_public_key(self.address):
-            errors.append(f"Invalid ss58 address: {self.address}")
-        if self.amount <= 0:
-            errors.append(f"Amount must be positive, got {self.amount}")
-        if self.amount < MIN_TRANSFER_TAO:
-            errors.append(
-                f"Amount {self.amount} TAO below minimum {MIN_TRANSFER_TAO} TAO"
-            )
-        return errors
-
-    @property
-    def amount_rao(self) -> int:
-        """Amount in RAO (1 TAO = 1e9 RAO)."""
-        return Balance.from_tao(self.amount).rao
-
-
-@dataclass
+@dataclass(slots=True)
 class BatchResult:
     """Result of a batch transfer operation."""
 
@@ -119,7 +100,7 @@ class BatchResult:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class FeeEstimate:
     """Fee estimate for a batch transfer."""
 
@@ -154,163 +135,40 @@ class FeeEstimate:
         return "\n".join(lines)
 
 
-def parse_recipients_csv(filepath: str | Path) -> list[Recipient]:
-    """
-    Parse a CSV file of recipients.
-
-    Expected format:
-        address,amount[,label]
-        5FHneW46xGXgs5mUiveU4sbTyGBzmstUspZC92UhjJM694ty,10.5,Alice
-        5GrwvaEF5zXb26Fz9rcQpDWS57CtERHpNehXCPcNoHGKutQY,5.0,Bob
-    """
-    recipients = []
-    filepath = Path(filepath)
-
-    with open(filepath, "r", newline="") as f:
-        reader = csv.DictReader(f)
-
-        # Normalize header names
-        if reader.fieldnames is None:
-            raise ValueError("CSV file is empty or has no headers")
-
-        headers = [h.strip().lower() for h in reader.fieldnames]
-
-        for row_num, row in enumerate(reader, start=2):
-            # Normalize keys
-            normalized = {k.strip().lower(): v.strip() for k, v in row.items()}
+# Short-lived cache for repeated RPC lookups. The typical flow runs
+# estimate_fee and then batch_transfer seconds apart against the same
+# wallet, which would otherwise repeat the balance and payment-info
+# round-trips. 5 seconds is well under a block time, so a cached value
+# can never hide a transfer that has already settled.
+_RPC_CACHE_TTL_SECONDS = 5.0
+_rpc_cache: dict[tuple, tuple[float, object]] = {}
 
-            address = normalized.get("address", "")
-            amount_str = normalized.get("amount", "0")
-            label = normalized.get("label", normalized.get("name", ""))
 
-            if not address:
-                raise ValueError(f"Row {row_num}: missing address")
-
-            try:
-                amount = float(amount_str)
-            except ValueError:
-                raise ValueError(
-                    f"Row {row_num}: invalid amount '{amount_str}'"
-                )
-
-            recipients.append(Recipient(
-                address=address,
-                amount=amount,
-                label=label,
-            ))
+def _rpc_cached(key: tuple, fetch, refresh: bool = False):
+    """Return fetch() memoized under key for _RPC_CACHE_TTL_SECONDS."""
+    now = time.monotonic()
+    if not refresh:
+        entry = _rpc_cache.get(key)
+        if entry is not None and now - entry[0] < _RPC_CACHE_TTL_SECONDS:
+            return entry[1]
+    value = fetch()
+    _rpc_cache[key] = (now, value)
+    return value
 
-    return recipients
 
-
-def parse_recipients_json(filepath: str | Path) -> list[Recipient]:
+def _transfer_call_dict(recipient: Recipient, transfer_fn: str) -> dict:
     """
-    Parse a JSON file of recipients.
-
-    Expected format:
-        [
-            {"address": "5FHne...", "amount": 10.5, "label": "Alice"},
-            {"address": "5Grwv...", "amount": 5.0}
-        ]
+    Inner Balances transfer in the plain dict form the SCALE codec
+    accepts inside a Utility batch. Composing each transfer through the
+    pallet wrapper resolves metadata and encodes per call; with dicts
+    the whole batch is resolved and encoded once when the outer
+    Utility call is composed.
     """
-    filepath = Path(filepath)
-    with open(filepath, "r") as f:
-        data = json.load(f)
-
-    if not isinstance(data, list):
-        raise ValueError("JSON must contain a list of recipient objects")
-
-    recipients = []
-    for i, entry in enumerate(data):
-        if not isinstance(entry, dict):
-            raise ValueError(f"Entry {i}: must be an object")
-        if "address" not in entry:
-            raise ValueError(f"Entry {i}: missing 'address' field")
-        if "amount" not in entry:
-            raise ValueError(f"Entry {i}: missing 'amount' field")
-
-        recipients.append(Recipient(
-            address=str(entry["address"]),
-            amount=float(entry["amount"]),
-            label=str(entry.get("label", "")),
-        ))
-
-    return recipients
-
-
-def parse_recipients(filepath: str | Path) -> list[Recipient]:
-    """Auto-detect file format and parse recipients."""
-    filepath = Path(filepath)
-    suffix = filepath.suffix.lower()
-    if suffix == ".json":
-        return parse_recipients_json(filepath)
-    elif suffix in (".csv", ".tsv", ".txt"):
-        return parse_recipients_csv(filepath)
-    else:
-        # Try CSV first, then JSON
-        try:
-            return parse_recipients_csv(filepath)
-        except Exception:
-            return parse_recipients_json(filepath)
-
-
-def validate_recipients(recipients: list[Recipient]) -> tuple[bool, list[str]]:
-    """
-    Validate all recipients. Returns (is_valid, list_of_errors).
-    Also checks for duplicate addresses.
-    """
-    errors = []
-    seen_addresses = {}
-
-    for i, r in enumerate(recipients):
-        r_errors = r.validate()
-        for err in r_errors:
-            errors.append(f"Recipient {i + 1} ({r.label or r.address[:12]}...): {err}")
-
-        # Check duplicates
-        if r.address in seen_addresses:
-            prev = seen_addresses[r.address]
-            errors.append(
-                f"Duplicate address at positions {prev + 1} and {i + 1}: {r.address[:16]}..."
-            )
-        seen_addresses[r.address] = i
-
-    return len(errors) == 0, errors
-
-
-def chunk_recipients(
-    recipients: list[Recipient], max_size: int = MAX_BATCH_SIZE
-) -> list[list[Recipient]]:
-    """Split recipients into chunks for batch processing."""
-    return [
-        recipients[i: i + max_size]
-        for i in range(0, len(recipients), max_size)
-    ]
-
-
-def calculate_spraay_fee(recipients: list[Recipient]) -> Optional[Recipient]:
-    """
-    Calculate the Spraay service fee for a batch of recipients.
-
-    Returns a Recipient representing the fee transfer to the Spraay wallet,
-    or None if fees are disabled or below the minimum threshold.
-
-    The fee is transparent and included in fee estimates shown to the user
-    before they confirm any transaction.
-    """
-    if not SPRAAY_FEE_WALLET or SPRAAY_FEE_PERCENT <= 0:
-        return None
-
-    total_amount = sum(r.amount for r in recipients)
-    fee_amount = total_amount * (SPRAAY_FEE_PERCENT / 100.0)
-
-    if fee_amount < SPRAAY_MIN_FEE_TAO:
-        return None
-
-    return Recipient(
-        address=SPRAAY_FEE_WALLET,
-        amount=round(fee_amount, 9),  # TAO has 9 decimal places (RAO)
-        label="Spraay service fee",
-    )
+    return {
+        "call_module": "Balances",
+        "call_function": transfer_fn,
+        "call_args": {"dest": recipient.address, "value": recipient.amount_rao},
+    }
 
 
 def _build_batch_call(
@@ -319,32 +177,25 @@ def _build_batch_call(
     keep_alive: bool = True,
     mode: BatchMode = BatchMode.BATCH_ALL,
     include_fee: bool = True,
+    fee_recipient: Optional[Recipient] = None,
 ) -> "GenericCall":
     """
     Build a utility.batch_all or utility.batch call containing
     multiple balance transfers, plus the Spraay service fee transfer.
-    """
-    balances = Balances(subtensor)
 
-    # Build individual transfer calls
+    Callers that already hold the chunk's fee (from summarize_chunks)
+    can pass it as fee_recipient to skip re-summing the chunk here.
+    """
     transfer_fn = "transfer_keep_alive" if keep_alive else "transfer_allow_death"
 
-    # Start with user recipients
-    all_recipients = list(recipients)
+    calls = [_transfer_call_dict(r, transfer_fn) for r in recipients]
 
     # Append Spraay fee as an additional transfer
     if include_fee:
-        fee_recipient = calculate_spraay_fee(recipients)
+        if fee_recipient is None:
+            fee_recipient = calculate_spraay_fee(recipients)
         if fee_recipient:
-            all_recipients.append(fee_recipient)
-
-    calls = []
-    for r in all_recipients:
-        call = getattr(balances, transfer_fn)(
-            dest=r.address,
-            value=r.amount_rao,
-        )
-        calls.append(call)
+            calls.append(_transfer_call_dict(fee_recipient, transfer_fn))
 
     # Wrap in utility.batch_all (atomic) or utility.batch (best-effort)
     batch_call = subtensor.compose_call(
@@ -361,41 +212,89 @@ def estimate_fee(
     recipients: list[Recipient],
     network: str = "finney",
     keep_alive: bool = True,
+    refresh: bool = False,
 ) -> FeeEstimate:
     """
     Estimate the fee for a batch transfer without executing it.
+
+    Balance and payment-info queries are memoized for a few seconds;
+    pass refresh=True to force fresh RPC lookups.
     """
     subtensor = bt.Subtensor(network=network)
     wallet = bt.Wallet(name=wallet_name)
 
-    total_amount = sum(r.amount for r in recipients)
-    chunks = chunk_recipients(recipients)
-
-    # Calculate Spraay service fee across all chunks
-    total_spraay_fee = 0.0
-    for chunk in chunks:
-        fee_recipient = calculate_spraay_fee(chunk)
-        if fee_recipient:
-            total_spraay_fee += fee_recipient.amount
-
-    # Estimate network fee for the first chunk (representative)
-    sample_call = _build_batch_call(subtensor, chunks[0], keep_alive)
+    chunks, _, chunk_fees, total_tao, total_spraay_fee = summarize_chunks(recipients)
+
+    # Estimate the network fee per chunk. Each payment_info query is an
+    # RPC round-trip, so multi-chunk jobs fan out over a thread pool;
+    # every worker opens its own connection because the underlying
+    # websocket is not safe for concurrent calls on one socket.
+    def _fee_for_chunk(
+        chunk: list[Recipient], has_fee: bool, st: Optional[bt.Subtensor] = None
+    ) -> float:
+        def fetch() -> float:
+            sub = st or bt.Subtensor(network=network)
+            call = _build_batch_call(sub, chunk, keep_alive)
+            fee_info = sub.substrate.get_payment_info(
+                call=call,
+                keypair=wallet.coldkey,
+            )
+            return Balance.from_rao(fee_info["partial_fee"]).tao if fee_info else 0.001
+
+        # Fee is weight-based, so the composed call's shape determines
+        # it: chunk length, keep_alive (which transfer variant), and
+        # whether a Spraay fee transfer is appended (one extra call)
+        key = (
+            "payment_info",
+            network,
+            wallet.coldkeypub.ss58_address,
+            len(chunk),
+            keep_alive,
+            has_fee,
+        )
+        return _rpc_cached(key, fetch, refresh)
+
+    # Fees depend on the chunk's composed shape — its size plus whether
+    # it carries the appended Spraay fee transfer — not on which
+    # addresses are in it. Query one representative chunk per distinct
+    # shape and multiply by how many chunks share it; chunking yields
+    # only a handful of shapes however many chunks the job has.
+    shape_reps: dict[tuple[int, bool], list[Recipient]] = {}
+    shape_counts: dict[tuple[int, bool], int] = {}
+    for chunk, fee_r in zip(chunks, chunk_fees):
+        shape = (len(chunk), fee_r is not None)
+        shape_reps.setdefault(shape, chunk)
+        shape_counts[shape] = shape_counts.get(shape, 0) + 1
+
+    shapes = list(shape_reps)
+    if not shapes:
+        total_network_fee = 0.0
+    elif len(shapes) == 1:
+        only = shapes[0]
+        total_network_fee = (
+            _fee_for_chunk(shape_reps[only], only[1], subtensor) * shape_counts[only]
+        )
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(shapes))) as ex:
+            fees = ex.map(
+                lambda shape: _fee_for_chunk(shape_reps[shape], shape[1]), shapes
+            )
+            total_network_fee = sum(
+                fee * shape_counts[shape] for shape, fee in zip(shapes, fees)
+            )
 
-    # Get fee estimate using the substrate interface
-    fee_info = subtensor.substrate.get_payment_info(
-        call=sample_call,
-        keypair=wallet.coldkey,
+    address = wallet.coldkeypub.ss58_address
+    current_balance = _rpc_cached(
+        ("balance", network, address),
+        lambda: subtensor.get_balance(address).tao,
+        refresh,
     )
-    fee_per_batch = Balance.from_rao(fee_info["partial_fee"]).tao if fee_info else 0.001
-    total_network_fee = fee_per_batch * len(chunks)
-
-    current_balance = subtensor.get_balance(wallet.coldkeypub.ss58_address).tao
-    total_cost = total_amount + total_network_fee + total_spraay_fee
+    total_cost = total_tao + total_network_fee + total_spraay_fee
 
     return FeeEstimate(
         estimated_fee=total_network_fee,
         spraay_fee=total_spraay_fee,
-        total_amount=total_amount,
+        total_amount=total_tao,
         total_cost=total_cost,
         recipient_count=len(recipients),
         batch_count=len(chunks),
@@ -412,6 +311,7 @@ def batch_transfer(
     mode: BatchMode = BatchMode.BATCH_ALL,
     wait_for_inclusion: bool = True,
     wait_for_finalization: bool = False,
+    validated: bool = False,
 ) -> list[BatchResult]:
     """
     Execute batch TAO transfers.
@@ -428,77 +328,176 @@ def batch_transfer(
         mode: BATCH_ALL (atomic) or BATCH (best-effort).
         wait_for_inclusion: Wait for the transaction to be included in a block.
         wait_for_finalization: Wait for the transaction to be finalized.
+        validated: Set True when the caller has already run
+            validate_recipients on this list, to skip re-validating.
 
     Returns:
         List of BatchResult objects, one per batch chunk.
     """
-    # Validate recipients first
-    is_valid, errors = validate_recipients(recipients)
-    if not is_valid:
-        return [BatchResult(
-            success=False,
-            message=f"Validation failed with {len(errors)} errors:\n" + "\n".join(errors),
-            recipient_count=len(recipients),
-        )]
+    return list(batch_transfer_stream(
+        wallet_name=wallet_name,
+        recipients=recipients,
+        network=network,
+        keep_alive=keep_alive,
+        mode=mode,
+        wait_for_inclusion=wait_for_inclusion,
+        wait_for_finalization=wait_for_finalization,
+        validated=validated,
+    ))
+
+
+def batch_transfer_stream(
+    wallet_name: str,
+    recipients: list[Recipient],
+    network: str = "finney",
+    keep_alive: bool = True,
+    mode: BatchMode = BatchMode.BATCH_ALL,
+    wait_for_inclusion: bool = True,
+    wait_for_finalization: bool = False,
+    validated: bool = False,
+) -> Iterator[BatchResult]:
+    """
+    Streaming variant of batch_transfer.
+
+    Yields each BatchResult as soon as its utility.batch_all extrinsic
+    completes, so callers can report progress while later chunks are
+    still in flight instead of waiting for the whole run. Same
+    parameters and per-chunk semantics as batch_transfer.
+    """
+    # Validate recipients first, unless the caller already has (the CLI
+    # validates once before its confirmation prompt)
+    if not validated:
+        is_valid, errors = validate_recipients(recipients)
+        if not is_valid:
+            yield BatchResult(
+                success=False,
+                message=f"Validation failed with {len(errors)} errors:\n" + "\n".join(errors),
+                recipient_count=len(recipients),
+            )
+            return
 
     subtensor = bt.Subtensor(network=network)
     wallet = bt.Wallet(name=wallet_name)
     wallet.unlock_coldkey()
 
-    total_amount = sum(r.amount for r in recipients)
-
-    # Calculate total Spraay fee across all chunks
-    chunks = chunk_recipients(recipients)
-    total_spraay_fee = 0.0
-    for chunk in chunks:
-        fee_r = calculate_spraay_fee(chunk)
-        if fee_r:
-            total_spraay_fee += fee_r.amount
-
-    # Check balance (must cover transfers + spraay fee + network fees)
-    balance = subtensor.get_balance(wallet.coldkeypub.ss58_address)
-    required = total_amount + total_spraay_fee
-    if balance.tao < required:
-        return [BatchResult(
+    chunks, chunk_sums, chunk_fees, total_tao, total_spraay_fee = summarize_chunks(
+        recipients
+    )
+    # Nothing to submit — an empty-but-parseable file yields no chunks
+    if not chunks:
+        return
+
+    # Check balance (must cover transfers + spraay fee + network fees).
+    # Reuses the balance fetched by a just-completed estimate_fee when
+    # it is still within the cache TTL.
+    address = wallet.coldkeypub.ss58_address
+    balance_tao = _rpc_cached(
+        ("balance", network, address),
+        lambda: subtensor.get_balance(address).tao,
+    )
+    required = total_tao + total_spraay_fee
+    if balance_tao < required:
+        yield BatchResult(
             success=False,
             message=(
-                f"Insufficient balance: {balance.tao:.4f} TAO available, "
+                f"Insufficient balance: {balance_tao:.4f} TAO available, "
                 f"but {required:.4f} TAO needed "
-                f"({total_amount:.4f} transfers + {total_spraay_fee:.6f} Spraay fee)."
+                f"({total_tao:.4f} transfers + {total_spraay_fee:.6f} Spraay fee)."
             ),
-            total_amount=total_amount,
+            total_amount=total_tao,
             spraay_fee=total_spraay_fee,
             recipient_count=len(recipients),
-        )]
-
-    # Split into chunks
-    results = []
-
+        )
+        return
+
+    # Compose every chunk's batch call up front on the shared
+    # connection. Composing walks the substrate metadata tree, and the
+    # fetched metadata is decoded and cached per connection — so doing
+    # it all here costs one metadata traversal for the whole job,
+    # instead of every worker connection repeating the fetch+decode
+    # during parallel submission. Build failures are captured per
+    # chunk and reported as that chunk's result without ever being
+    # submitted (or assigned a nonce). Fees reuse the per-chunk values
+    # computed above (include_fee=False when a chunk fell below the
+    # minimum).
+    prepared_calls: list = []
+    build_errors: dict[int, str] = {}
     for chunk_idx, chunk in enumerate(chunks):
+        fee_r = chunk_fees[chunk_idx]
+        try:
+            prepared_calls.append(_build_batch_call(
+                subtensor,
+                chunk,
+                keep_alive,
+                mode,
+                include_fee=fee_r is not None,
+                fee_recipient=fee_r,
+            ))
+        except Exception as e:
+            prepared_calls.append(None)
+            build_errors[chunk_idx] = str(e)
+
+    # Set when a parallel submission dies before broadcast: its nonce
+    # is burned, and any not-yet-submitted chunk holding a higher
+    # nonce would sit behind the gap until the RPC times out. Those
+    # chunks are skipped and reported instead.
+    nonce_gap = threading.Event()
+
+    def _submit_chunk(
+        chunk_idx: int,
+        st: Optional[bt.Subtensor] = None,
+        nonce: Optional[int] = None,
+    ) -> BatchResult:
+        chunk = chunks[chunk_idx]
+        chunk_amount = chunk_sums[chunk_idx]
+        fee_r = chunk_fees[chunk_idx]
+        chunk_spraay_fee = fee_r.amount if fee_r else 0.0
         start_time = time.time()
-        chunk_amount = sum(r.amount for r in chunk)
-        chunk_spraay_fee = 0.0
-        fee_r = calculate_spraay_fee(chunk)
-        if fee_r:
-            chunk_spraay_fee = fee_r.amount
+
+        batch_call = prepared_calls[chunk_idx]
+        if batch_call is None:
+            return BatchResult(
+                success=False,
+                message=f"Batch {chunk_idx + 1}/{len(chunks)} exception: {build_errors[chunk_idx]}",
+                total_amount=chunk_amount,
+                spraay_fee=chunk_spraay_fee,
+                recipient_count=len(chunk),
+            )
+
+        if nonce is not None and nonce_gap.is_set():
+            return BatchResult(
+                success=False,
+                message=(
+                    f"Batch {chunk_idx + 1}/{len(chunks)} skipped: an earlier "
+                    f"batch failed before broadcast, leaving a nonce gap this "
+                    f"batch would stall behind. Re-run to retry the remainder."
+                ),
+                total_amount=chunk_amount,
+                spraay_fee=chunk_spraay_fee,
+                recipient_count=len(chunk),
+            )
 
         try:
-            # Build the batch call
-            batch_call = _build_batch_call(subtensor, chunk, keep_alive, mode)
+            # Each parallel submission opens its own connection; the
+            # underlying websocket is not safe for concurrent calls on
+            # one socket.
+            st = st or bt.Subtensor(network=network)
 
             # Sign and submit
-            response = subtensor.sign_and_send_extrinsic(
+            submit_kwargs = {} if nonce is None else {"nonce": nonce}
+            response = st.sign_and_send_extrinsic(
                 call=batch_call,
                 wallet=wallet,
                 wait_for_inclusion=wait_for_inclusion,
                 wait_for_finalization=wait_for_finalization,
+                **submit_kwargs,
             )
 
             duration = time.time() - start_time
 
             if response.success:
-                block_hash = subtensor.get_block_hash()
-                results.append(BatchResult(
+                block_hash = st.get_block_hash()
+                return BatchResult(
                     success=True,
                     message=f"Batch {chunk_idx + 1}/{len(chunks)} completed successfully",
                     block_hash=block_hash,
@@ -508,29 +507,55 @@ def batch_transfer(
                     spraay_fee=chunk_spraay_fee,
                     recipient_count=len(chunk),
                     duration_seconds=duration,
-                ))
-            else:
-                results.append(BatchResult(
-                    success=False,
-                    message=f"Batch {chunk_idx + 1}/{len(chunks)} failed: {response.message}",
-                    total_amount=chunk_amount,
-                    spraay_fee=chunk_spraay_fee,
-                    recipient_count=len(chunk),
-                    duration_seconds=duration,
-                ))
+                )
+            return BatchResult(
+                success=False,
+                message=f"Batch {chunk_idx + 1}/{len(chunks)} failed: {response.message}",
+                total_amount=chunk_amount,
+                spraay_fee=chunk_spraay_fee,
+                recipient_count=len(chunk),
+                duration_seconds=duration,
+            )
 
         except Exception as e:
+            # The extrinsic may never have been broadcast, so this
+            # chunk's nonce may never be consumed on-chain — stop
+            # handing later nonces to chunks that haven't submitted yet
+            nonce_gap.set()
             duration = time.time() - start_time
-            results.append(BatchResult(
+            return BatchResult(
                 success=False,
                 message=f"Batch {chunk_idx + 1}/{len(chunks)} exception: {str(e)}",
                 total_amount=chunk_amount,
                 spraay_fee=chunk_spraay_fee,
                 recipient_count=len(chunk),
                 duration_seconds=duration,
-            ))
+            )
 
-    return results
+    if len(chunks) == 1:
+        yield _submit_chunk(0, subtensor)
+        return
+
+    # Chunks are independent extrinsics, so submit them in parallel
+    # with consecutive nonces rather than blocking a full block time
+    # per chunk. Results are yielded in chunk order as they complete.
+    # Only chunks that actually composed get a nonce — assigning one
+    # to a chunk that never broadcasts would leave every later
+    # extrinsic stuck behind the gap.
+    submittable = [i for i in range(len(chunks)) if prepared_calls[i] is not None]
+    submit_nonces: dict[int, int] = {}
+    if submittable:
+        start_nonce = subtensor.substrate.get_account_next_index(address)
+        submit_nonces = {
+            i: start_nonce + offset for offset, i in enumerate(submittable)
+        }
+    with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as ex:
+        futures = [
+            ex.submit(_submit_chunk, i, None, submit_nonces.get(i))
+            for i in range(len(chunks))
+        ]
+        for future in futures:
+            yield future.result()
 
 
 async def async_batch_transfer(
@@ -541,102 +566,161 @@ async def async_batch_transfer(
     mode: BatchMode = BatchMode.BATCH_ALL,
     wait_for_inclusion: bool = True,
     wait_for_finalization: bool = False,
+    max_concurrency: int = 4,
+    validated: bool = False,
 ) -> list[BatchResult]:
     """
     Async version of batch_transfer.
 
     Same functionality as batch_transfer but uses AsyncSubtensor
     for non-blocking execution. Preferred for web server integrations.
+
+    Chunks are independent extrinsics, so they are signed with explicit
+    consecutive nonces and submitted concurrently (up to max_concurrency
+    in flight) instead of waiting a full block per chunk. Results are
+    returned in chunk order regardless of completion order.
     """
-    # Validate recipients
-    is_valid, errors = validate_recipients(recipients)
-    if not is_valid:
-        return [BatchResult(
-            success=False,
-            message=f"Validation failed with {len(errors)} errors:\n" + "\n".join(errors),
-            recipient_count=len(recipients),
-        )]
+    # Validate recipients, unless the caller already has
+    if not validated:
+        is_valid, errors = validate_recipients(recipients)
+        if not is_valid:
+            return [BatchResult(
+                success=False,
+                message=f"Validation failed with {len(errors)} errors:\n" + "\n".join(errors),
+                recipient_count=len(recipients),
+            )]
 
     async with bt.AsyncSubtensor(network=network) as subtensor:
         wallet = bt.Wallet(name=wallet_name)
         wallet.unlock_coldkey()
 
-        total_amount = sum(r.amount for r in recipients)
+        total_tao = total_amount(recipients)
 
         # Check balance
         balance = await subtensor.get_balance(wallet.coldkeypub.ss58_address)
-        if balance.tao < total_amount:
+        if balance.tao < total_tao:
             return [BatchResult(
                 success=False,
                 message=(
                     f"Insufficient balance: {balance.tao:.4f} TAO available, "
-                    f"but {total_amount:.4f} TAO needed."
+                    f"but {total_tao:.4f} TAO needed."
                 ),
-                total_amount=total_amount,
+                total_amount=total_tao,
                 recipient_count=len(recipients),
             )]
 
-        chunks = chunk_recipients(recipients)
-        results = []
+        chunks, chunk_sums, _, _, _ = summarize_chunks(recipients)
 
-        for chunk_idx, chunk in enumerate(chunks):
-            start_time = time.time()
-            chunk_amount = sum(r.amount for r in chunk)
+        # Build every chunk's batch call before submitting anything, so
+        # submission itself is pure network I/O. Build failures are
+        # captured per chunk and reported as that chunk's result
+        # without ever being submitted (or assigned a nonce).
+        transfer_fn = "transfer_keep_alive" if keep_alive else "transfer_allow_death"
 
+        batch_calls = []
+        build_errors: dict[int, str] = {}
+        for chunk_idx, chunk in enumerate(chunks):
+            calls = [_transfer_call_dict(r, transfer_fn) for r in chunk]
             try:
-                balances_pallet = Balances(subtensor)
-                transfer_fn = "transfer_keep_alive" if keep_alive else "transfer_allow_death"
-
-                calls = []
-                for r in chunk:
-                    call = await getattr(balances_pallet, transfer_fn)(
-                        dest=r.address,
-                        value=r.amount_rao,
-                    )
-                    calls.append(call)
-
-                batch_call = await subtensor.compose_call(
+                batch_calls.append(await subtensor.compose_call(
                     call_module="Utility",
                     call_function=mode.value,
                     call_params={"calls": calls},
+                ))
+            except Exception as e:
+                batch_calls.append(None)
+                build_errors[chunk_idx] = str(e)
+
+        # Each in-flight extrinsic needs its own nonce, assigned
+        # consecutively from the account's next index — but only to
+        # chunks that actually composed: a nonce handed to a chunk
+        # that never broadcasts leaves every later extrinsic stuck
+        # behind the gap.
+        submittable = [i for i in range(len(chunks)) if batch_calls[i] is not None]
+        submit_nonces: dict[int, int] = {}
+        if submittable:
+            start_nonce = await subtensor.substrate.get_account_next_index(
+                wallet.coldkeypub.ss58_address
+            )
+            submit_nonces = {
+                i: start_nonce + offset for offset, i in enumerate(submittable)
+            }
+        semaphore = asyncio.Semaphore(max_concurrency)
+        # Set when a submission dies before broadcast, burning its
+        # nonce; not-yet-submitted chunks skip instead of stalling
+        nonce_gap = asyncio.Event()
+
+        async def _submit(chunk_idx: int, batch_call) -> BatchResult:
+            chunk = chunks[chunk_idx]
+            chunk_amount = chunk_sums[chunk_idx]
+
+            if batch_call is None:
+                return BatchResult(
+                    success=False,
+                    message=f"Batch {chunk_idx + 1}/{len(chunks)} exception: {build_errors[chunk_idx]}",
+                    total_amount=chunk_amount,
+                    recipient_count=len(chunk),
                 )
 
-                response = await subtensor.sign_and_send_extrinsic(
-                    call=batch_call,
-                    wallet=wallet,
-                    wait_for_inclusion=wait_for_inclusion,
-                    wait_for_finalization=wait_for_finalization,
-                )
+            async with semaphore:
+                if nonce_gap.is_set():
+                    return BatchResult(
+                        success=False,
+                        message=(
+                            f"Batch {chunk_idx + 1}/{len(chunks)} skipped: an "
+                            f"earlier batch failed before broadcast, leaving a "
+                            f"nonce gap this batch would stall behind. Re-run "
+                            f"to retry the remainder."
+                        ),
+                        total_amount=chunk_amount,
+                        recipient_count=len(chunk),
+                    )
 
-                duration = time.time() - start_time
+                start_time = time.time()
+                try:
+                    response = await subtensor.sign_and_send_extrinsic(
+                        call=batch_call,
+                        wallet=wallet,
+                        nonce=submit_nonces[chunk_idx],
+                        wait_for_inclusion=wait_for_inclusion,
+                        wait_for_finalization=wait_for_finalization,
+                    )
 
-                if response.success:
-                    block_hash = await subtensor.get_block_hash()
-                    results.append(BatchResult(
-                        success=True,
-                        message=f"Batch {chunk_idx + 1}/{len(chunks)} completed",
-                        block_hash=block_hash,
+                    duration = time.time() - start_time
+
+                    if response.success:
+                        block_hash = await subtensor.get_block_hash()
+                        return BatchResult(
+                            success=True,
+                            message=f"Batch {chunk_idx + 1}/{len(chunks)} completed",
+                            block_hash=block_hash,
+                            total_amount=chunk_amount,
+                            recipient_count=len(chunk),
+                            duration_seconds=duration,
+                        )
+                    return BatchResult(
+                        success=False,
+                        message=f"Batch {chunk_idx + 1}/{len(chunks)} failed: {response.message}",
                         total_amount=chunk_amount,
                         recipient_count=len(chunk),
                         duration_seconds=duration,
-                    ))
-                else:
-                    results.append(BatchResult(
+                    )
+
+                except Exception as e:
+                    # The extrinsic may never have been broadcast, so
+                    # its nonce may never be consumed on-chain
+                    nonce_gap.set()
+                    duration = time.time() - start_time
+                    return BatchResult(
                         success=False,
-                        message=f"Batch {chunk_idx + 1}/{len(chunks)} failed: {response.message}",
+                        message=f"Batch {chunk_idx + 1}/{len(chunks)} exception: {str(e)}",
                         total_amount=chunk_amount,
                         recipient_count=len(chunk),
                         duration_seconds=duration,
-                    ))
+                    )
 
-            except Exception as e:
-                duration = time.time() - start_time
-                results.append(BatchResult(
-                    success=False,
-                    message=f"Batch {chunk_idx + 1}/{len(chunks)} exception: {str(e)}",
-                    total_amount=chunk_amount,
-                    recipient_count=len(chunk),
-                    duration_seconds=duration,
-                ))
+        results = list(await asyncio.gather(
+            *(_submit(i, call) for i, call in enumerate(batch_calls))
+        ))
 
     return results
@@ -0,0 +1,553 @@
+"""
+Recipient file parsing and validation for Spraay TAO.
+
+Everything here is chain-free: no bittensor / substrateinterface
+imports, so the CLI can parse, validate, and fee-preview recipient
+lists without paying the multi-second cold start of the chain stack.
+The transfer/estimate paths in spraay_tao.batch build on these
+primitives and re-export them for backwards compatibility.
+"""
+
+from __future__ import annotations
+
+import csv
+import functools
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional
+
+try:
+    import orjson  # optional C-accelerated JSON (pip install spraay-tao[fast])
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # optional incremental JSON (pip install spraay-tao[fast])
+except ImportError:
+    ijson = None
+
+
+# Maximum recipients per batch transaction.
+# Substrate utility.batch has no hard limit, but larger batches
+# consume more weight. 199 to leave room for the fee transfer.
+MAX_BATCH_SIZE = 199
+
+# Minimum transfer amount in TAO (existential deposit protection)
+MIN_TRANSFER_TAO = 0.0005  # 500,000 RAO
+
+# 1 TAO = 1e9 RAO. Totals and fee math accumulate in integer RAO so
+# float rounding can never drift a batch total by a RAO; TAO floats
+# appear only at display boundaries.
+RAO_PER_TAO = 1_000_000_000
+
+# Read buffer for recipient files. Large payout lists are parsed as a
+# stream; a 1 MiB buffer keeps syscall count low without holding the
+# whole file in memory.
+FILE_BUFFER_SIZE = 1 << 20
+
+# JSON files above this size are parsed incrementally with ijson (when
+# installed) instead of decoded in one shot, keeping peak memory flat.
+# Below it, a one-shot orjson/json decode is faster.
+LARGE_JSON_THRESHOLD = 32 << 20  # 32 MiB
+
+# ── Spraay Service Fee ──────────────────────────────────────────
+# A small transparent fee is appended as an additional transfer
+# within each batch. Shown upfront in fee estimates.
+# Set to 0.0 to disable (e.g. for grant-funded deployments).
+SPRAAY_FEE_PERCENT = 0.3  # 0.3% of total batch amount
+SPRAAY_FEE_WALLET = "5CZjqeHFjmj39KuXanRApouyKFXokjazeor6h3bPoCzuzmJC"
+SPRAAY_MIN_FEE_TAO = 0.001  # Minimum fee per batch (below this, no fee charged)
+
+# SPRAAY_FEE_PERCENT as an exact integer ratio, so the fee can be
+# computed in RAO: fee_rao = total_rao * _FEE_NUMERATOR // _FEE_DENOMINATOR
+_FEE_NUMERATOR = round(SPRAAY_FEE_PERCENT * 10_000)  # 0.3% -> 3000
+_FEE_DENOMINATOR = 100 * 10_000
+_MIN_FEE_RAO = round(SPRAAY_MIN_FEE_TAO * RAO_PER_TAO)
+
+# Bittensor uses the generic Substrate ss58 prefix
+SS58_FORMAT = 42
+
+# Structural prefilters for address validation. Anything that fails
+# these cannot possibly pass the full base58 + checksum validation, so
+# malformed addresses are rejected without a base58 decode. Compiled
+# once at import; .match bound directly to skip an attribute lookup in
+# the hot loop.
+_SS58_RE = re.compile(r"^[1-9A-HJ-NP-Za-km-z]{46,48}$").match
+_PUBKEY_HEX_RE = re.compile(r"^(?:0x)?[0-9a-fA-F]{64}$").match
+
+_B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_B58_INDEX = {c: i for i, c in enumerate(_B58_ALPHABET)}
+
+
+def _ss58_checksum_ok(address: str) -> bool:
+    """
+    Decode an ss58 address and verify its blake2b checksum.
+
+    Pure-stdlib equivalent of the bittensor address check (one-byte
+    ss58 prefix, 32-byte key, 2-byte checksum over b"SS58PRE" + body),
+    kept here so validation does not need the chain libraries.
+    """
+    num = 0
+    for ch in address:
+        idx = _B58_INDEX.get(ch)
+        if idx is None:
+            return False
+        num = num * 58 + idx
+    raw = num.to_bytes((num.bit_length() + 7) // 8, "big")
+    # Leading '1' characters encode leading zero bytes
+    pad = len(address) - len(address.lstrip("1"))
+    raw = b"\x00" * pad + raw
+
+    if len(raw) != 35:  # 1-byte prefix + 32-byte key + 2-byte checksum
+        return False
+    if raw[0] != SS58_FORMAT:
+        return False
+    checksum = hashlib.blake2b(b"SS58PRE" + raw[:-2], digest_size=64).digest()[:2]
+    return raw[-2:] == checksum
+
+
+@functools.lru_cache(maxsize=100_000)
+def _address_is_valid(address: str) -> bool:
+    """
+    Cheap, cached address check.
+
+    Recipient lists often repeat addresses across validate/transfer
+    reruns; the cache collapses the base58 + blake2b checksum work to
+    one call per distinct address.
+    """
+    # Cheap length branch first, then the structural regex; only
+    # plausible candidates reach the cryptographic checksum.
+    n = len(address)
+    if 46 <= n <= 48 and _SS58_RE(address):
+        return _ss58_checksum_ok(address)
+    # 32-byte public keys (hex, with or without 0x) are also accepted
+    if n in (64, 66) and _PUBKEY_HEX_RE(address):
+        return True
+    return False
+
+
+@functools.lru_cache(maxsize=4096)
+def _tao_to_rao(amount: float) -> int:
+    """
+    TAO to integer RAO, cached per distinct amount — airdrops commonly
+    send one identical amount to thousands of addresses.
+    """
+    return int(round(amount * RAO_PER_TAO))
+
+
+@dataclass(slots=True)
+class Recipient:
+    """
+    A single payment recipient.
+
+    slots=True drops the per-instance __dict__ — at ~100 bytes per
+    instance that is a real saving when million-row payout lists are
+    materialized.
+    """
+
+    address: str
+    amount: float  # in TAO
+    label: str = ""  # optional label/note
+    # Amount in RAO (1 TAO = 1e9 RAO), precomputed so batch building
+    # doesn't construct a Balance object per recipient per chunk
+    amount_rao: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        self.amount_rao = _tao_to_rao(self.amount)
+
+    @property
+    def short(self) -> str:
+        """Shortened display form ("5GrwvaEF...KutQY") for previews."""
+        a = self.address
+        return f"{a[:16]}...{a[-8:]}" if len(a) > 27 else a
+
+    def validate(self) -> list[str]:
+        """Validate this recipient. Returns list of error strings."""
+        errors = []
+        if not _address_is_valid(self.address):
+            errors.append(f"Invalid ss58 address: {self.address}")
+        if self.amount <= 0:
+            errors.append(f"Amount must be positive, got {self.amount}")
+        if self.amount < MIN_TRANSFER_TAO:
+            errors.append(
+                f"Amount {self.amount} TAO below minimum {MIN_TRANSFER_TAO} TAO"
+            )
+        return errors
+
+
+
+def parse_recipients_csv(filepath: str | Path) -> list[Recipient]:
+    """
+    Parse a CSV file of recipients.
+
+    Expected format:
+        address,amount[,label]
+        5FHneW46xGXgs5mUiveU4sbTyGBzmstUspZC92UhjJM694ty,10.5,Alice
+        5GrwvaEF5zXb26Fz9rcQpDWS57CtERHpNehXCPcNoHGKutQY,5.0,Bob
+    """
+    return list(iter_recipients_csv(filepath))
+
+
+def iter_recipients_csv(filepath: str | Path) -> Iterator[Recipient]:
+    """
+    Stream recipients from a CSV file, one row at a time.
+
+    Same format as parse_recipients_csv, but yields each Recipient as
+    soon as its row is read, so peak memory stays flat regardless of
+    file size and downstream validation can overlap with disk reads.
+    """
+    filepath = Path(filepath)
+
+    with open(
+        filepath, "r", newline="", buffering=FILE_BUFFER_SIZE, encoding="utf-8"
+    ) as f:
+        reader = csv.reader(f)
+
+        # Resolve column positions from the header once, so the row
+        # loop indexes fixed integers instead of building a normalized
+        # dict (plus per-cell strip/lower) for every row
+        try:
+            header = next(reader)
+        except StopIteration:
+            raise ValueError("CSV file is empty or has no headers")
+
+        columns = [h.strip().lower() for h in header]
+        if "address" not in columns:
+            raise ValueError("CSV file has no 'address' column")
+        if "amount" not in columns:
+            raise ValueError("CSV file has no 'amount' column")
+        addr_idx = columns.index("address")
+        amount_idx = columns.index("amount")
+        if "label" in columns:
+            label_idx = columns.index("label")
+        elif "name" in columns:
+            label_idx = columns.index("name")
+        else:
+            label_idx = -1
+
+        for row_num, row in enumerate(reader, start=2):
+            if not row:
+                continue  # skip blank lines, as DictReader did
+
+            try:
+                address = row[addr_idx].strip()
+                amount_str = row[amount_idx].strip()
+            except IndexError:
+                raise ValueError(
+                    f"Row {row_num}: expected {len(columns)} columns, got {len(row)}"
+                )
+            label = row[label_idx].strip() if 0 <= label_idx < len(row) else ""
+
+            if not address:
+                raise ValueError(f"Row {row_num}: missing address")
+
+            try:
+                amount = float(amount_str)
+            except ValueError:
+                raise ValueError(
+                    f"Row {row_num}: invalid amount '{amount_str}'"
+                )
+
+            yield Recipient(
+                address=address,
+                amount=amount,
+                label=label,
+            )
+
+
+def parse_recipients_json(filepath: str | Path) -> list[Recipient]:
+    """
+    Parse a JSON file of recipients.
+
+    Expected format:
+        [
+            {"address": "5FHne...", "amount": 10.5, "label": "Alice"},
+            {"address": "5Grwv...", "amount": 5.0}
+        ]
+    """
+    return list(iter_recipients_json(filepath))
+
+
+def iter_recipients_json(filepath: str | Path) -> Iterator[Recipient]:
+    """
+    Stream recipients from a JSON file.
+
+    Small files are decoded in one shot (orjson when installed, stdlib
+    json otherwise). Files over LARGE_JSON_THRESHOLD are parsed
+    element-by-element with ijson when it is installed, so peak memory
+    stays flat however large the drop file is; without ijson they fall
+    back to the one-shot decode.
+    """
+    filepath = Path(filepath)
+
+    if ijson is not None and filepath.stat().st_size > LARGE_JSON_THRESHOLD:
+        with open(filepath, "rb", buffering=FILE_BUFFER_SIZE) as f:
+            yield from _recipients_from_entries(ijson.items(f, "item"))
+        return
+
+    raw = filepath.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    if not isinstance(data, list):
+        raise ValueError("JSON must contain a list of recipient objects")
+
+    yield from _recipients_from_entries(data)
+
+
+def _recipients_from_entries(entries) -> Iterator[Recipient]:
+    """Convert decoded JSON objects to Recipients, validating shape."""
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Entry {i}: must be an object")
+        if "address" not in entry:
+            raise ValueError(f"Entry {i}: missing 'address' field")
+        if "amount" not in entry:
+            raise ValueError(f"Entry {i}: missing 'amount' field")
+
+        yield Recipient(
+            address=str(entry["address"]),
+            amount=float(entry["amount"]),  # also accepts ijson's Decimal
+            label=str(entry.get("label", "")),
+        )
+
+
+def parse_recipients(filepath: str | Path) -> list[Recipient]:
+    """Auto-detect file format and parse recipients."""
+    return list(parse_recipients_stream(filepath))
+
+
+def parse_recipients_stream(filepath: str | Path) -> Iterator[Recipient]:
+    """
+    Auto-detect file format and stream recipients lazily.
+
+    Preferred entry point for the CLI: recipients are yielded as they
+    are parsed, so validation and aggregation overlap with file I/O
+    instead of waiting for the whole list to materialize.
+    """
+    filepath = Path(filepath)
+    suffix = filepath.suffix.lower()
+    if suffix == ".json":
+        yield from iter_recipients_json(filepath)
+    elif suffix in (".csv", ".tsv", ".txt"):
+        yield from iter_recipients_csv(filepath)
+    else:
+        # Try CSV first, then JSON. Materialize here so a mid-stream
+        # CSV failure doesn't leak partial rows before the JSON retry.
+        try:
+            recipients = list(iter_recipients_csv(filepath))
+        except Exception:
+            recipients = list(iter_recipients_json(filepath))
+        yield from recipients
+
+
+def total_rao(recipients: list[Recipient]) -> int:
+    """
+    Sum of recipient amounts in integer RAO.
+
+    Integer accumulation is exact — float sums over thousands of
+    9-decimal amounts can drift by a RAO, enough to skew fee math.
+    Uses a vectorized NumPy reduction (numpy ships with bittensor) for
+    large lists; falls back to sum() if numpy is unavailable.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return sum(r.amount_rao for r in recipients)
+    amounts = np.fromiter(
+        (r.amount_rao for r in recipients), dtype=np.int64, count=len(recipients)
+    )
+    return int(amounts.sum())
+
+
+def total_amount(recipients: list[Recipient]) -> float:
+    """Sum of recipient amounts in TAO (exact RAO total, scaled)."""
+    return total_rao(recipients) / RAO_PER_TAO
+
+
+def amount_stats(recipients: list[Recipient]) -> tuple[float, float, float, float]:
+    """
+    (total, mean, min, max) of recipient amounts in one vectorized pass.
+
+    Raises ValueError on an empty list, matching min()/max() semantics.
+    """
+    if not recipients:
+        raise ValueError("amount_stats() requires at least one recipient")
+    try:
+        import numpy as np
+    except ImportError:
+        amounts = [r.amount for r in recipients]
+        total = sum(amounts)
+        return total, total / len(amounts), min(amounts), max(amounts)
+    amounts = np.fromiter(
+        (r.amount for r in recipients), dtype=np.float64, count=len(recipients)
+    )
+    return (
+        float(amounts.sum()),
+        float(amounts.mean()),
+        float(amounts.min()),
+        float(amounts.max()),
+    )
+
+
+def validate_recipients(recipients: list[Recipient]) -> tuple[bool, list[str]]:
+    """
+    Validate all recipients. Returns (is_valid, list_of_errors).
+    Also checks for duplicate addresses.
+
+    The checks from Recipient.validate() are inlined here so the happy
+    path allocates nothing per recipient — no per-element error list
+    and no error strings formatted unless a check actually fails.
+    """
+    errors: list[str] = []
+    seen_addresses: dict[str, int] = {}
+
+    for i, r in enumerate(recipients):
+        addr = r.address
+        amt = r.amount
+
+        if not _address_is_valid(addr):
+            errors.append(
+                f"Recipient {i + 1} ({r.label or addr[:12]}...): "
+                f"Invalid ss58 address: {addr}"
+            )
+        # One comparison covers both amount checks (MIN_TRANSFER_TAO > 0)
+        if amt < MIN_TRANSFER_TAO:
+            if amt <= 0:
+                detail = f"Amount must be positive, got {amt}"
+            else:
+                detail = f"Amount {amt} TAO below minimum {MIN_TRANSFER_TAO} TAO"
+            errors.append(f"Recipient {i + 1} ({r.label or addr[:12]}...): {detail}")
+
+        prev = seen_addresses.get(addr)
+        if prev is not None:
+            errors.append(
+                f"Duplicate address at positions {prev + 1} and {i + 1}: {addr[:16]}..."
+            )
+        seen_addresses[addr] = i
+
+    return len(errors) == 0, errors
+
+
+# Below this size, process startup costs more than the validation the
+# workers would save.
+PARALLEL_VALIDATE_THRESHOLD = 10_000
+
+
+def _validate_slice(job: tuple[int, list[Recipient]]) -> list[str]:
+    """Per-recipient validation for one contiguous slice (worker side)."""
+    offset, recipients = job
+    errors = []
+    for i, r in enumerate(recipients, start=offset):
+        for err in r.validate():
+            errors.append(f"Recipient {i + 1} ({r.label or r.address[:12]}...): {err}")
+    return errors
+
+
+def validate_recipients_parallel(
+    recipients: list[Recipient],
+) -> tuple[bool, list[str]]:
+    """
+    validate_recipients with multi-core fan-out for large lists.
+
+    ss58 checksum work is pure CPU and independent per recipient, so
+    lists above PARALLEL_VALIDATE_THRESHOLD are split into contiguous
+    slices (keeping error numbering stable) and validated in a process
+    pool. Duplicate detection needs global state and stays in the
+    parent, where a set walk is cheap. Small lists fall through to the
+    serial path untouched.
+    """
+    if len(recipients) < PARALLEL_VALIDATE_THRESHOLD:
+        return validate_recipients(recipients)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = os.cpu_count() or 1
+    step = -(-len(recipients) // workers)  # ceil division
+    jobs = [
+        (start, recipients[start: start + step])
+        for start in range(0, len(recipients), step)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        parts = list(ex.map(_validate_slice, jobs))
+    errors = [err for part in parts for err in part]
+
+    seen_addresses: dict[str, int] = {}
+    for i, r in enumerate(recipients):
+        if r.address in seen_addresses:
+            prev = seen_addresses[r.address]
+            errors.append(
+                f"Duplicate address at positions {prev + 1} and {i + 1}: {r.address[:16]}..."
+            )
+        else:
+            seen_addresses[r.address] = i
+
+    return len(errors) == 0, errors
+
+
+def chunk_recipients(
+    recipients: list[Recipient], max_size: int = MAX_BATCH_SIZE
+) -> list[list[Recipient]]:
+    """Split recipients into chunks for batch processing."""
+    return [
+        recipients[i: i + max_size]
+        for i in range(0, len(recipients), max_size)
+    ]
+
+
+def _fee_recipient_for_total_rao(batch_rao: int) -> Optional[Recipient]:
+    """Spraay fee transfer for an already-computed batch total, in RAO."""
+    if not SPRAAY_FEE_WALLET or SPRAAY_FEE_PERCENT <= 0:
+        return None
+
+    fee_rao = batch_rao * _FEE_NUMERATOR // _FEE_DENOMINATOR
+
+    if fee_rao < _MIN_FEE_RAO:
+        return None
+
+    return Recipient(
+        address=SPRAAY_FEE_WALLET,
+        amount=fee_rao / RAO_PER_TAO,
+        label="Spraay service fee",
+    )
+
+
+def calculate_spraay_fee(recipients: list[Recipient]) -> Optional[Recipient]:
+    """
+    Calculate the Spraay service fee for a batch of recipients.
+
+    Returns a Recipient representing the fee transfer to the Spraay wallet,
+    or None if fees are disabled or below the minimum threshold.
+
+    The fee is transparent and included in fee estimates shown to the user
+    before they confirm any transaction.
+    """
+    return _fee_recipient_for_total_rao(total_rao(recipients))
+
+
+def summarize_chunks(
+    recipients: list[Recipient], max_size: int = MAX_BATCH_SIZE
+) -> tuple[list[list[Recipient]], list[float], list[Optional[Recipient]], float, float]:
+    """
+    Chunk recipients and compute all per-chunk aggregates in one pass.
+
+    Returns (chunks, chunk_sums, chunk_fees, total_amount,
+    total_spraay_fee). Both estimate_fee and the transfer path need all
+    five; computing them together avoids re-summing each chunk inside
+    calculate_spraay_fee and walking the full list a third time for the
+    grand total. Aggregation runs in integer RAO internally; the
+    returned sums and totals are TAO floats for display.
+    """
+    chunks = chunk_recipients(recipients, max_size)
+    chunk_raos = [total_rao(chunk) for chunk in chunks]
+    chunk_fees = [_fee_recipient_for_total_rao(r) for r in chunk_raos]
+    return (
+        chunks,
+        [r / RAO_PER_TAO for r in chunk_raos],
+        chunk_fees,
+        sum(chunk_raos) / RAO_PER_TAO,
+        sum(fee.amount for fee in chunk_fees if fee),
+    )